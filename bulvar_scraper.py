@@ -7,13 +7,14 @@ Author: Jan Alexandr Kopřiva jan.alexandr.kopriva@gmail.com
 License: MIT
 """
 
-import requests
-import xml.etree.ElementTree as ET
+import aiohttp
+import asyncio
+import io
+from concurrent.futures import ProcessPoolExecutor
+from lxml import etree
 from datetime import datetime
 import re
-import chardet
 import os
-import glob
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
 from rich.panel import Panel
@@ -22,6 +23,33 @@ from rich.text import Text
 # Initialize Rich Console
 console = Console()
 
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Pre-compiled patterns for clean_title, so the hot path skips the re cache lookup
+_CDATA_RE = re.compile(r'<!\[CDATA\[(.*?)\]\]>')
+
+_PROB_COMBINED = re.compile(r'^[A-Z\s]+$')
+
+def _is_ascii_lower(word):
+    """True if word consists solely of ASCII lowercase letters."""
+    return word.isascii() and word.isalpha() and word.islower()
+
+def _is_navigation(title):
+    """Check for likely navigation items: one capitalized word followed by up to 10 lowercase words.
+
+    Equivalent to the former combined navigation regex, but built from
+    C-level str operations so no regex engine runs on the hot path.
+    """
+    parts = title.split()
+    if not 1 <= len(parts) <= 11:
+        return False
+    first = parts[0]
+    if not ('A' <= first[0] <= 'Z' and len(first) > 1 and _is_ascii_lower(first[1:])):
+        return False
+    return all(_is_ascii_lower(part) for part in parts[1:])
+
 ASCII_ART = r"""
 ▛▀▖   ▜                               
 ▙▄▘▌ ▌▐▌ ▌▝▀▖▙▀▖ ▞▀▘▞▀▖▙▀▖▝▀▖▛▀▖▞▀▖▙▀▖
@@ -33,98 +61,76 @@ def print_art():
     """Print embedded ASCII art."""
     console.print(Text(ASCII_ART, style="bold white"))
 
-def fetch_rss_feed(url):
-    """Fetch RSS feed from the given URL."""
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        raw_content = response.content
-        detected = chardet.detect(raw_content)
-        encoding = detected['encoding'] if detected['encoding'] else 'utf-8'
-        
+async def fetch_rss_feed(session, url, retries=2, backoff=0.5):
+    """Fetch RSS feed from the given URL, retrying transient failures."""
+    for attempt in range(retries + 1):
         try:
-            content = raw_content.decode(encoding)
-        except UnicodeDecodeError:
-            content = raw_content.decode('utf-8', errors='ignore')
-        
-        return content
-    except requests.RequestException:
-        # Suppress error print here to let the UI handle it
-        return None
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                response.raise_for_status()
+                # Return raw bytes; lxml reads the encoding from the XML declaration
+                return await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == retries:
+                # Suppress error print here to let the UI handle it
+                return None
+            await asyncio.sleep(backoff * 2 ** attempt)
 
 def clean_title(title):
     """Clean and filter title text."""
     if not title:
         return ""
-    
-    title = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', title)
-    title = re.sub(r'\s+', ' ', title.strip())
-    
+
+    # Cheap pre-check: cleaning only shortens a title, so anything already
+    # under the length filter can be discarded before any regex runs
+    has_cdata = '<![CDATA[' in title
+    if not has_cdata and len(title) < 20:
+        return ""
+
+    if has_cdata:
+        title = _CDATA_RE.sub(r'\1', title)
+    title = ' '.join(title.split())
+
     # Skip likely navigation items or empty content
     if len(title) < 20:
         return ""
-    
+
     if title.isupper() and len(title) < 50:
         return ""
-    
-    navigation_patterns = [
-        r'^[A-Z][a-z]+$',
-        r'^[A-Z][a-z]+\s+[a-z]+$',
-        r'^[A-Z][a-z]+\s+[a-z]+\s+[a-z]+$',
-        r'^[A-Z][a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+$',
-        r'^[A-Z][a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+$',
-        r'^[A-Z][a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+$',
-        r'^[A-Z][a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+$',
-        r'^[A-Z][a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+$',
-        r'^[A-Z][a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+$',
-        r'^[A-Z][a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+$',
-    ]
-    
-    for pattern in navigation_patterns:
-        if re.match(pattern, title):
-            return ""
-    
-    problematic_patterns = [
-        r'^[A-Z\s]+$',
-        r'^[A-Z][a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+\s+[a-z]+$',
-    ]
-    
-    for pattern in problematic_patterns:
-        if re.match(pattern, title):
-            return ""
-    
+
+    if _is_navigation(title):
+        return ""
+
+    if _PROB_COMBINED.match(title):
+        return ""
+
     return title
 
 def extract_titles(xml_content):
-    """Extract titles from RSS XML content."""
+    """Yield cleaned titles from raw RSS XML bytes."""
     try:
-        root = ET.fromstring(xml_content)
-        titles = []
-        
-        items = root.findall('.//item')
-        if not items:
-            items = root.findall('.//entry')  # Atom support
-        
-        for item in items:
+        context = etree.iterparse(
+            io.BytesIO(xml_content),
+            tag=('item', 'entry', '{http://www.w3.org/2005/Atom}entry')  # RSS + Atom support
+        )
+        for _, item in context:
             title_elem = item.find('title')
+            if title_elem is None:
+                title_elem = item.find('{http://www.w3.org/2005/Atom}title')
             if title_elem is not None and title_elem.text:
                 clean_title_text = clean_title(title_elem.text)
                 if clean_title_text:
-                    titles.append(clean_title_text)
-        
-        return titles
-        
-    except ET.ParseError:
-        return []
+                    yield clean_title_text
+            item.clear()  # Free each item as soon as its title is extracted
 
-def main():
-    """Main function to scrape all feeds and save titles to one file."""
-    print_art()
-    
+    except etree.XMLSyntaxError:
+        return
+
+def _extract_titles_list(xml_content):
+    """Materialize extract_titles into a list for transport across the process pool."""
+    return list(extract_titles(xml_content))
+
+async def run(out_file):
+    """Fetch all feeds concurrently, streaming their titles to out_file."""
     feeds = {
         'super_cz': 'https://www.super.cz/rss',
         'blesk_cz': 'https://www.blesk.cz/rss',
@@ -146,10 +152,8 @@ def main():
         'ct24_cz': 'https://ct24.ceskatelevize.cz/rss/tema/vyber-redakce-84313'
     }
     
-    all_titles = []
-    
-    console.print("[bold white]Starting scraper...[/bold white]")
-    
+    total_count = 0
+
     with Progress(
         SpinnerColumn(style="bold white"),
         TextColumn("[progress.description]{task.description}"),
@@ -158,50 +162,73 @@ def main():
         TimeElapsedColumn(),
         console=console
     ) as progress:
-        
+
         task = progress.add_task("[bold white]Scraping feeds...", total=len(feeds))
-        
-        for feed_name, url in feeds.items():
-            progress.update(task, description=f"[white]Scraping {feed_name}...")
-            
-            xml_content = fetch_rss_feed(url)
-            if xml_content:
-                titles = extract_titles(xml_content)
-                all_titles.extend(titles)
-                # We can print individual successes if we want, but it might clutter the progress bar area
-                # console.print(f"[green]✓ {feed_name}: {len(titles)} titles[/green]") 
-            else:
-                console.print(f"[bold white]✗ Failed to fetch {feed_name}[/bold white]")
-            
-            progress.advance(task)
-            
-    console.print(f"[bold white]Scraping finished![/bold white] Found [bold white]{len(all_titles)}[/bold white] titles total.")
-
-    if all_titles:
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        output_dir = os.path.join(script_dir, "scraped_output")
-        os.makedirs(output_dir, exist_ok=True)
-        
-        for old_file_path in glob.glob(os.path.join(output_dir, "titles_*.txt")):
-            try:
-                os.remove(old_file_path)
-            except OSError:
-                pass
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"titles_{timestamp}.txt"
-        filepath = os.path.join(output_dir, filename)
-        
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                for title in all_titles:
-                    f.write(f"{title}\n")
-            
-            console.print(Panel(f"Saved {len(all_titles)} titles to:\n[bold white]{filepath}[/bold white]", title="Success", border_style="white"))
-            
-        except IOError as e:
-            console.print(f"[bold white]Error saving file:[/bold white] {e}")
+
+        connector = aiohttp.TCPConnector(limit_per_host=4, limit=64)
+        loop = asyncio.get_running_loop()
+        # Parse feeds on worker processes so the GIL-bound XML/cleaning work
+        # overlaps with network waits for the remaining feeds
+        with ProcessPoolExecutor() as pool:
+            async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+
+                async def fetch_one(feed_name, url):
+                    return feed_name, await fetch_rss_feed(session, url)
+
+                for future in asyncio.as_completed([fetch_one(name, url) for name, url in feeds.items()]):
+                    feed_name, xml_content = await future
+                    if xml_content:
+                        titles = await loop.run_in_executor(pool, _extract_titles_list, xml_content)
+                        if titles:
+                            out_file.writelines(title + '\n' for title in titles)
+                            total_count += len(titles)
+                        # We can print individual successes if we want, but it might clutter the progress bar area
+                        # console.print(f"[green]✓ {feed_name}: {len(titles)} titles[/green]")
+                    else:
+                        console.print(f"[bold white]✗ Failed to fetch {feed_name}[/bold white]")
+
+                    progress.advance(task)
+
+    return total_count
+
+def main():
+    """Main function to scrape all feeds and save titles to one file."""
+    print_art()
+
+    console.print("[bold white]Starting scraper...[/bold white]")
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    output_dir = os.path.join(script_dir, "scraped_output")
+    os.makedirs(output_dir, exist_ok=True)
+
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("titles_") and entry.name.endswith(".txt"):
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = f"titles_{timestamp}.txt"
+    filepath = os.path.join(output_dir, filename)
+
+    try:
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            total_count = asyncio.run(run(f))
+    except IOError as e:
+        console.print(f"[bold white]Error saving file:[/bold white] {e}")
+        return
+
+    console.print(f"[bold white]Scraping finished![/bold white] Found [bold white]{total_count}[/bold white] titles total.")
+
+    if total_count:
+        console.print(Panel(f"Saved {total_count} titles to:\n[bold white]{filepath}[/bold white]", title="Success", border_style="white"))
     else:
+        try:
+            os.remove(filepath)
+        except OSError:
+            pass
         console.print("[bold white]No titles found.[/bold white]")
 
 if __name__ == "__main__":